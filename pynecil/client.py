@@ -6,12 +6,21 @@ import asyncio
 import hashlib
 import logging
 import struct
+import time
+from dataclasses import dataclass
+from enum import Enum
+from functools import lru_cache
 from math import floor
-from typing import TYPE_CHECKING, Any, cast
+from typing import TYPE_CHECKING, Any, TypeVar, cast
+from uuid import UUID
 
 from bleak import BleakClient, BleakScanner
 from bleak.backends.device import BLEDevice
-from bleak.exc import BleakError
+from bleak.exc import (
+    BleakCharacteristicNotFoundError,
+    BleakDeviceNotFoundError,
+    BleakError,
+)
 
 from . import const
 from .exceptions import CommunicationError
@@ -38,10 +47,35 @@ from .types import (
 )
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import AsyncIterator, Awaitable, Callable
+
+    from bleak.backends.characteristic import BleakGATTCharacteristic
 
 _LOGGER = logging.getLogger(__package__)
 
+_EnumT = TypeVar("_EnumT", bound=Enum)
+_T = TypeVar("_T")
+
+_from_bytes = int.from_bytes
+
+# Bulk live data payload: 14 unsigned 32-bit little-endian integers
+LIVE_DATA_STRUCT = struct.Struct("<14I")
+# Settings values: unsigned 16-bit little-endian integer
+UINT16_STRUCT = struct.Struct("<H")
+
+SVC_UUID_BULK_STR = str(const.SVC_UUID_BULK)
+
+# GATT request errors that will not go away by retrying the request
+PERMANENT_GATT_ERRORS = (BleakCharacteristicNotFoundError, BleakDeviceNotFoundError)
+
+# Hashes of the known language codes, the member values of LanguageCode are the
+# ironOS hashes of their names
+LANGUAGE_CODE_HASHES: dict[str, int] = {code.name: code.value for code in LanguageCode}
+
+# Members of the enums in live data by value, calling the enum class is comparatively slow
+POWER_SOURCES: dict[int, PowerSource] = {src.value: src for src in PowerSource}
+OPERATING_MODES: dict[int, OperatingMode] = {mode.value: mode for mode in OperatingMode}
+
 
 async def discover(timeout: float = 10) -> BLEDevice | None:
     """Discover Pinecil device.
@@ -58,11 +92,12 @@ async def discover(timeout: float = 10) -> BLEDevice | None:
             before the timeout.
 
     """
-    return await BleakScanner().find_device_by_filter(
-        filterfunc=lambda _, advertisement: bool(
-            str(const.SVC_UUID_BULK) in advertisement.service_uuids
+    return await BleakScanner.find_device_by_filter(
+        filterfunc=lambda _, advertisement: (
+            SVC_UUID_BULK_STR in advertisement.service_uuids
         ),
         timeout=timeout,
+        service_uuids=[SVC_UUID_BULK_STR],
     )
 
 
@@ -83,6 +118,8 @@ class Pynecil:
         self,
         address_or_ble_device: BLEDevice | str,
         disconnected_callback: Callable[[BleakClient], None] | None = None,
+        max_concurrent_reads: int = 4,
+        settings_cache_ttl: float = 0,
     ) -> None:
         """Initialize a Pynecil client.
 
@@ -95,6 +132,19 @@ class Pynecil:
             Callback passed to BleakClient that will be scheduled in the event loop
             when the client is disconnected. The callable must take one argument,
             which will be the client object. Defaults to None.
+        max_concurrent_reads : int, optional
+            Maximum number of GATT read requests kept in flight at the same time,
+            e.g. when fetching all settings. Set to 1 for BLE stacks that only handle
+            sequential requests. Defaults to 4.
+        settings_cache_ttl : float, optional
+            Time in seconds a value read from a setting characteristic is reused
+            instead of reading it again. Writing a setting invalidates its cached
+            value. Defaults to 0, which disables caching.
+
+        Raises
+        ------
+        ValueError
+            If `max_concurrent_reads` is less than 1.
 
         Notes
         -----
@@ -107,22 +157,45 @@ class Pynecil:
         disconnection.
 
         """
+        if max_concurrent_reads < 1:
+            raise ValueError("max_concurrent_reads must be at least 1")
         if isinstance(address_or_ble_device, BLEDevice):
             self.device_info = DeviceInfoResponse(
                 name=address_or_ble_device.name, address=address_or_ble_device.address
             )
         else:
             self.device_info = DeviceInfoResponse(address=address_or_ble_device)
+        self._live_data: LiveDataResponse | None = None
+        self._live_data_raw: bytearray | None = None
+        self._live_notifying = False
+        self._live_data_queues: set[asyncio.Queue[bytearray | None]] = set()
+        self._connected = False
+        self._gatt_characteristics: dict[UUID, BleakGATTCharacteristic] = {}
+        self._settings_cache_ttl = settings_cache_ttl
+        self._settings_cache: dict[UUID, tuple[float, bytes]] = {}
 
         def _disconnected_callback(client: BleakClient) -> None:
             _LOGGER.debug("Disconnected from %s", client.address)
             self.client_disconnected = True
             self.device_info.is_synced = False
 
+        def _on_disconnect(client: BleakClient) -> None:
+            self._connected = False
+            self._gatt_characteristics = {}
+            self._settings_cache.clear()
+            self._live_notifying = False
+            self._live_data = self._live_data_raw = None
+            for queue in self._live_data_queues:
+                _put_latest(queue, None)
+            (disconnected_callback or _disconnected_callback)(client)
+
         self._client = BleakClient(
-            address_or_ble_device,
-            disconnected_callback=disconnected_callback or _disconnected_callback,
+            address_or_ble_device, disconnected_callback=_on_disconnect
         )
+        self._read_semaphore = asyncio.Semaphore(max_concurrent_reads)
+        self._pending_reads: dict[UUID, asyncio.Future[bytes]] = {}
+        self._connection_request: Any = None
+        self._connect_lock = asyncio.Lock()
 
     @property
     def is_connected(self) -> bool:
@@ -151,6 +224,10 @@ class Pynecil:
         - If `self.client_disconnected` is `True`, indicating a previous unexpected
         disconnection, the method first closes the stale connection by calling `disconnect()`
         before attempting to establish a new connection.
+        - Concurrent calls are serialized, so requests failing together after a
+        dropped link trigger a single reconnect.
+        - After connecting, a short connection interval is requested from the BLE stack
+        where the backend supports it, to reduce the latency of each GATT operation.
 
         Raises
         ------
@@ -158,15 +235,52 @@ class Pynecil:
             If an error occurs during the connection attempt.
 
         """
-        if not self._client.is_connected:
-            if self.client_disconnected:  # close stale connection
-                await self.disconnect()
-            await self._client.connect()
+        async with self._connect_lock:
+            if not self._client.is_connected:
+                if self.client_disconnected:  # close stale connection
+                    await self.disconnect()
+                await self._client.connect()
+                self._request_connection_priority()
+                # resolve characteristics once, bleak otherwise searches all of them
+                # for the UUID on every request
+                self._gatt_characteristics = {
+                    UUID(characteristic.uuid): characteristic
+                    for characteristic in self._client.services.characteristics.values()
+                }
+            self._connected = True
+
+    def _request_connection_priority(self) -> None:
+        """Request throughput optimized connection parameters.
+
+        Only the WinRT backend allows a client to request connection parameters, on
+        other platforms they are left to the operating system's BLE stack.
+
+        """
+        requester = getattr(self._client._backend, "_requester", None)
+        if requester is None:
+            return
+        try:
+            from winrt.windows.devices.bluetooth import (  # type: ignore[import-not-found]
+                BluetoothLEPreferredConnectionParameters,
+            )
+
+            # the request is only active as long as a reference to it is kept
+            self._connection_request = (
+                requester.request_preferred_connection_parameters(
+                    BluetoothLEPreferredConnectionParameters.throughput_optimized
+                )
+            )
+        except (ImportError, AttributeError, OSError) as e:
+            _LOGGER.debug("Failed to request connection parameters: %s", e)
 
     async def disconnect(self) -> None:
         """Disconnect from the Pinecil device."""
+        self._connected = False
+        self._gatt_characteristics = {}
+        self._settings_cache.clear()
         await self._client.disconnect()
         self.client_disconnected = False
+        self._live_data = self._live_data_raw = None
 
     async def get_device_info(self) -> DeviceInfoResponse:
         """Retrieve device information from the Pinecil V2 device.
@@ -193,14 +307,17 @@ class Pynecil:
         if self.device_info.is_synced:
             return self.device_info
 
-        try:
-            self.device_info.build = await self.read(CharBulk.BUILD)
-            self.device_info.device_sn = await self.read(CharBulk.DEVICE_SN)
-            self.device_info.device_id = await self.read(CharBulk.DEVICE_ID)
-            self.device_info.is_synced = True
-        except (BleakError, TimeoutError) as e:
-            _LOGGER.debug("Get device characteristics exception: %s", e)
-            raise CommunicationError from e
+        await self._ensure_connected()
+        (
+            self.device_info.build,
+            self.device_info.device_sn,
+            self.device_info.device_id,
+        ) = await asyncio.gather(
+            self.read(CharBulk.BUILD),
+            self.read(CharBulk.DEVICE_SN),
+            self.read(CharBulk.DEVICE_ID),
+        )
+        self.device_info.is_synced = True
 
         return self.device_info
 
@@ -219,9 +336,98 @@ class Pynecil:
         CommunicationError
             If an error occurred while connecting and retrieving data from device.
 
+        Notes
+        -----
+        If live data notifications were enabled with `start_live_notifications`, the
+        most recently pushed value is returned without reading the characteristic.
+
         """
+        if self._live_data_raw is not None:
+            if self._live_data is None:
+                self._live_data = decode_live_data(self._live_data_raw)
+            return self._live_data
         return await self.read(CharBulk.LIVE_DATA)
 
+    async def start_live_notifications(self) -> bool:
+        """Subscribe to notifications of the bulk live data characteristic.
+
+        Returns
+        -------
+        bool
+            `True` if the device accepted the subscription, `False` otherwise. In the
+            latter case `get_live_data` keeps reading the characteristic on each call.
+
+        Notes
+        -----
+        The subscription ends when the device disconnects and has to be renewed after
+        reconnecting.
+
+        """
+        if self._live_notifying and self.is_connected:
+            return True
+        try:
+            await self.connect()
+            await self._client.start_notify(
+                const.CHAR_UUID_BULK_LIVE_DATA, self._on_live_data
+            )
+        except (BleakError, TimeoutError) as e:
+            _LOGGER.debug("Failed to subscribe to live data notifications: %s", e)
+            return False
+        self._live_notifying = True
+        return True
+
+    async def stream_live_data(
+        self, interval: float = 1.0
+    ) -> AsyncIterator[LiveDataResponse]:
+        """Yield live sensor data as the device pushes it.
+
+        Parameters
+        ----------
+        interval : float, optional
+            Polling interval in seconds, used only if the device does not support
+            notifications of the bulk live data characteristic. Default is 1.0.
+
+        Yields
+        ------
+        LiveDataResponse
+            The most recent live data. Values pushed while the consumer is busy are
+            dropped in favour of newer ones.
+
+        Raises
+        ------
+        CommunicationError
+            If an error occurred while polling the device.
+
+        Notes
+        -----
+        When notifications are used, the stream ends once the device disconnects.
+
+        """
+        if not await self.start_live_notifications():
+            while True:
+                yield await self.read(CharBulk.LIVE_DATA)
+                await asyncio.sleep(interval)
+
+        queue: asyncio.Queue[bytearray | None] = asyncio.Queue(maxsize=1)
+        self._live_data_queues.add(queue)
+        try:
+            while (data := await queue.get()) is not None:
+                yield decode_live_data(data)
+        finally:
+            self._live_data_queues.discard(queue)
+
+    def _on_live_data(self, _: BleakGATTCharacteristic, data: bytearray) -> None:
+        """Store live data pushed by the device.
+
+        Decoding is deferred to `get_live_data`, so notifications arriving faster
+        than they are consumed are not decoded in vain.
+
+        """
+        self._live_data_raw = data
+        self._live_data = None
+        for queue in self._live_data_queues:
+            _put_latest(queue, data)
+
     async def get_settings(
         self, settings: list[CharSetting | int] | None = None
     ) -> SettingsDataResponse:
@@ -250,24 +456,23 @@ class Pynecil:
         filtering based on the provided `settings` list.
 
         """
-        if settings is None:
-            settings = []
-        tasks = [
-            (characteristic.name.lower(), self.read(characteristic))
-            for characteristic in CHAR_MAP
-            if isinstance(characteristic, CharSetting)
-            and (
-                not settings
-                or characteristic in settings
-                or characteristic.value in settings
+        await self._ensure_connected()
+        selected = (
+            frozenset(
+                SETTINGS_BY_ID.get(s, s) if isinstance(s, int) else s for s in settings
             )
-        ]
-        results = await asyncio.gather(*(task[1] for task in tasks))
-
-        return cast(
-            SettingsDataResponse,
-            {key: value for (key, _), value in zip(tasks, results)},
+            if settings
+            else None
         )
+        keys = []
+        reads = []
+        for characteristic, name in SETTINGS:
+            if selected is None or characteristic in selected:
+                keys.append(name)
+                reads.append(self.read(characteristic))
+        results = await asyncio.gather(*reads)
+
+        return cast(SettingsDataResponse, dict(zip(keys, results)))
 
     async def read(self, characteristic: Characteristic) -> Any:
         """Read specified characteristic and decode the result.
@@ -288,20 +493,37 @@ class Pynecil:
             If an error occurred while connecting and retrieving data from device.
 
         """
-        uuid, decode, *_ = CHAR_MAP.get(characteristic, (None, None))
+        spec = CHAR_MAP.get(characteristic)
 
-        if not (decode and uuid):
+        if spec is None:
             return None
+        uuid, decode = spec.uuid, spec.decode
+
+        cache_setting = self._settings_cache_ttl > 0 and isinstance(
+            characteristic, CharSetting
+        )
+        if cache_setting and (cached := self._settings_cache.get(uuid)) is not None:
+            read_at, result = cached
+            if time.monotonic() - read_at < self._settings_cache_ttl:
+                return decode(result)
+
+        # concurrent reads of the same characteristic share one GATT request
+        pending = self._pending_reads.get(uuid)
+        if pending is None:
+            pending = asyncio.ensure_future(self._read_gatt_char(uuid))
+            self._pending_reads[uuid] = pending
+            pending.add_done_callback(lambda _: self._pending_reads.pop(uuid, None))
 
         try:
-            await self.connect()
-            result = await self._client.read_gatt_char(uuid)
+            result = await asyncio.shield(pending)
             _LOGGER.debug(
                 "Read characteristic %s, result: %s", str(uuid), decode(result)
             )
         except (BleakError, TimeoutError) as e:
             _LOGGER.debug("Failed to read characteristic %s: %s", str(uuid), e)
             raise CommunicationError from e
+        if cache_setting:
+            self._settings_cache[uuid] = (time.monotonic(), result)
         return decode(result)
 
     async def write(self, setting: CharSetting, value: Any) -> None:
@@ -322,29 +544,159 @@ class Pynecil:
             If an error occurs while connecting to or writing data to the device.
 
         """
-        uuid, _, convert, validate = CHAR_MAP.get(setting, (None, None, None, None))
+        spec, data = _encode_setting(setting, value)
+        uuid = spec.uuid
+        response = spec.response or not self._supports_write_command(uuid)
+        # reads issued after this write must not join a read started before it
+        self._pending_reads.pop(uuid, None)
 
-        if not (convert and validate):
-            raise ValueError(
-                f"No conversion or validation functions found for {setting}"
+        try:
+            await self._gatt_request(
+                lambda: self._client.write_gatt_char(
+                    self._resolve(uuid), encode_int(data), response=response
+                )
             )
+            _LOGGER.debug("Wrote characteristic %s with value: %s", str(uuid), value)
+        except (BleakError, TimeoutError) as e:
+            _LOGGER.debug("Failed to write characteristic %s: %s", str(uuid), e)
+            raise CommunicationError from e
+        finally:
+            # also drops values of reads that were in flight during the write
+            self._settings_cache.pop(uuid, None)
+
+    async def write_many(self, settings: dict[CharSetting, Any]) -> None:
+        """Write several settings concurrently.
 
-        data = validate(convert(value))
+        Parameters
+        ----------
+        settings : dict[CharSetting, Any]
+            The characteristics to write to, mapped to the values to write.
+
+        Raises
+        ------
+        ValueError
+            If no conversion or validation functions are found for one of the
+            settings, or one of the values cannot be converted. Nothing is written
+            in this case.
+        CommunicationError
+            If an error occurs while connecting to or writing data to the device.
+
+        """
+        for setting, value in settings.items():
+            _encode_setting(setting, value)
+
+        await self._ensure_connected()
+        await asyncio.gather(
+            *(self.write(setting, value) for setting, value in settings.items())
+        )
+
+    async def _ensure_connected(self) -> None:
+        """Connect once before issuing a batch of concurrent requests.
+
+        Raises
+        ------
+        CommunicationError
+            If the connection could not be established.
+
+        """
+        if self._connected:
+            return
         try:
             await self.connect()
-            await self._client.write_gatt_char(uuid, encode_int(data))
-            _LOGGER.debug("Wrote characteristic %s with value: %s", str(uuid), value)
         except (BleakError, TimeoutError) as e:
-            _LOGGER.debug("Failed to write characteristic %s: %s", str(uuid), e)
+            _LOGGER.debug("Failed to connect to %s: %s", self._client.address, e)
             raise CommunicationError from e
 
+    async def _read_gatt_char(self, uuid: UUID) -> bytes:
+        """Read the raw value of a characteristic, limiting concurrent requests."""
+        async with self._read_semaphore:
+            # decoders operate on immutable, hashable bytes
+            return bytes(
+                await self._gatt_request(
+                    lambda: self._client.read_gatt_char(self._resolve(uuid))
+                )
+            )
+
+    def _resolve(self, uuid: UUID) -> BleakGATTCharacteristic | UUID:
+        """Return the resolved GATT characteristic for a UUID if available."""
+        return self._gatt_characteristics.get(uuid, uuid)
+
+    def _supports_write_command(self, uuid: UUID) -> bool:
+        """Check if a characteristic supports write without response."""
+        characteristic = self._gatt_characteristics.get(uuid)
+        return (
+            characteristic is not None
+            and "write-without-response" in characteristic.properties
+        )
+
+    async def _gatt_request(self, request: Callable[[], Awaitable[_T]]) -> _T:
+        """Perform a GATT request, retrying it on transient errors.
+
+        Parameters
+        ----------
+        request : Callable[[], Awaitable[_T]]
+            Function starting the GATT request.
+
+        Returns
+        -------
+        _T
+            The result of the request.
 
-def decode_int(value: bytearray) -> int:
+        Raises
+        ------
+        BleakError
+            If the request still fails after `const.GATT_MAX_ATTEMPTS` attempts, the
+            error is permanent, or the connection could not be established.
+        TimeoutError
+            If the request still times out after `const.GATT_MAX_ATTEMPTS` attempts.
+
+        Notes
+        -----
+        The connection is re-established before retrying if it was lost, so a single
+        dropped packet does not force the caller to reconnect. Connecting itself is
+        not retried, it already waits for bleak's connection timeout.
+
+        """
+        attempt = 1
+        while True:
+            if not self._connected:
+                await self.connect()
+            try:
+                return await request()
+            except (BleakError, TimeoutError) as e:
+                if (
+                    isinstance(e, PERMANENT_GATT_ERRORS)
+                    or attempt >= const.GATT_MAX_ATTEMPTS
+                ):
+                    raise
+                self._connected = False
+                _LOGGER.debug("GATT request failed (attempt %s): %s", attempt, e)
+                await asyncio.sleep(const.GATT_RETRY_DELAY * attempt)
+                attempt += 1
+
+
+def _put_latest(queue: asyncio.Queue[_T], item: _T) -> None:
+    """Put an item into a bounded queue, discarding the oldest item if full."""
+    if queue.full():
+        queue.get_nowait()
+    queue.put_nowait(item)
+
+
+def _encode_setting(setting: CharSetting, value: Any) -> tuple[CharacteristicSpec, int]:
+    """Convert and validate a value to be written to a setting characteristic."""
+    spec = CHAR_MAP.get(setting)
+
+    if spec is None or spec.convert is None or spec.validate is None:
+        raise ValueError(f"No conversion or validation functions found for {setting}")
+    return spec, spec.validate(spec.convert(value))
+
+
+def decode_int(value: bytes) -> int:
     """Decode byte-encoded integer value to an integer.
 
     Parameters
     ----------
-    value : bytearray
+    value : bytes
         Byte-encoded integer value to decode.
 
     Returns
@@ -357,15 +709,15 @@ def decode_int(value: bytearray) -> int:
     The byte order is little-endian, and the integer is treated as unsigned.
 
     """
-    return int.from_bytes(value, byteorder="little", signed=False)
+    return _from_bytes(value, "little")
 
 
-def decode_str(value: bytearray) -> str:
+def decode_str(value: bytes) -> str:
     """Decode byte-encoded string to a UTF-8 string.
 
     Parameters
     ----------
-    value : bytearray
+    value : bytes
         Byte-encoded string to decode.
 
     Returns
@@ -383,12 +735,12 @@ def decode_str(value: bytearray) -> str:
     return value.decode("utf-8")
 
 
-def decode_live_data(value: bytearray) -> LiveDataResponse:
-    """Parse bytearray from bulk live data into LiveDataResponse.
+def decode_live_data(value: bytes) -> LiveDataResponse:
+    """Parse bytes from bulk live data into LiveDataResponse.
 
     Parameters
     ----------
-    value : bytearray
+    value : bytes
         Byte value from bulk live data characteristic.
 
     Returns
@@ -411,21 +763,21 @@ def decode_live_data(value: bytearray) -> LiveDataResponse:
         - estimated_power: float (normalized)
 
     """
-    data = struct.unpack("14I", value)
+    data = LIVE_DATA_STRUCT.unpack_from(value)
     return LiveDataResponse(
         data[0],
         data[1],
         data[2] / 10,
         data[3] / 10,
-        int(data[4] / 255 * 100),
-        PowerSource(data[5]),
+        data[4] * 100 // 255,
+        POWER_SOURCES.get(data[5]) or PowerSource(data[5]),
         data[6] / 10,
         data[7] / 10,
         data[8] / 10,
         data[9],
         data[10],
         data[11],
-        OperatingMode(data[12]),
+        OPERATING_MODES.get(data[12]) or OperatingMode(data[12]),
         data[13] / 10,
     )
 
@@ -454,8 +806,31 @@ def clip(a: int, a_min: int, a_max: int) -> int:
         - Otherwise, return `a` itself.
 
     """
-    a = min(a, a_max)
-    return max(a, a_min)
+    return a_min if a < a_min else a_max if a > a_max else a
+
+
+def clip_validator(a_min: int, a_max: int) -> Callable[[int], int]:
+    """Create a validator clipping values between max and min.
+
+    Parameters
+    ----------
+    a_min : int
+        The lower bound for the value.
+    a_max : int
+        The upper bound for the value.
+
+    Returns
+    -------
+    Callable[[int], int]
+        Function returning its argument clipped to the bounds, equivalent
+        to `clip(a, a_min, a_max)`.
+
+    """
+
+    def validate(a: int) -> int:
+        return a_min if a < a_min else a_max if a > a_max else a
+
+    return validate
 
 
 def encode_int(value: int) -> bytes:
@@ -473,7 +848,7 @@ def encode_int(value: int) -> bytes:
         occupying 2 bytes.
 
     """
-    return value.to_bytes(2, byteorder="little", signed=False)
+    return UINT16_STRUCT.pack(value)
 
 
 def encode_lang_code(language_code: str | LanguageCode) -> int:
@@ -494,23 +869,45 @@ def encode_lang_code(language_code: str | LanguageCode) -> int:
 
     Notes
     -----
-    If language_code is a member of LanguageCode enum, its integer value is returned directly.
-    Otherwise, language_code is hashed using SHA-1, and the resulting hash is converted to an integer
-    and returned.
+    If language_code is a member of LanguageCode enum or the name of one, its integer value
+    is returned directly. Otherwise, language_code is hashed using SHA-1, and the resulting
+    hash is converted to an integer and returned.
 
     """
     if isinstance(language_code, LanguageCode):
         return int(language_code.value)
 
-    return int(hashlib.sha1(language_code.encode("utf-8")).hexdigest(), 16) % 0xFFFF
+    if (value := LANGUAGE_CODE_HASHES.get(language_code)) is not None:
+        return value
 
+    return hash_lang_code(language_code)
 
-def decode_lang_code(raw: bytearray) -> LanguageCode | int | None:
+
+@lru_cache(maxsize=64)
+def hash_lang_code(language_code: str) -> int:
+    """Hash a language code with the algorithm used in ironOS.
+
+    Parameters
+    ----------
+    language_code : str
+        The language code to hash.
+
+    Returns
+    -------
+    int
+        The SHA-1 hash of the language code, reduced to 16 bit.
+
+    """
+    digest = hashlib.sha1(language_code.encode("utf-8")).digest()
+    return _from_bytes(digest, "big") % 0xFFFF
+
+
+def decode_lang_code(raw: bytes) -> LanguageCode | int | None:
     """Decode hashed value to language code.
 
     Parameters
     ----------
-    raw : bytearray
+    raw : bytes
         A byte-encoded integer value representing the hashed language code.
 
     Returns
@@ -527,302 +924,438 @@ def decode_lang_code(raw: bytearray) -> LanguageCode | int | None:
         return decode_int(raw)
 
 
+def decode_int_div10(value: bytes) -> float:
+    """Decode byte-encoded integer value scaled by 10 to a float."""
+    return _from_bytes(value, "little") / 10
+
+
+def decode_bool(value: bytes) -> bool:
+    """Decode byte-encoded integer value to a boolean."""
+    return bool(_from_bytes(value, "little"))
+
+
+def decode_pwm_level(value: bytes) -> int:
+    """Decode byte-encoded PWM level (0-255) to percent."""
+    return _from_bytes(value, "little") * 100 // 255
+
+
+def decode_device_sn(value: bytes) -> str:
+    """Decode byte-encoded device serial number to a hex string."""
+    return f"{_from_bytes(value, 'little'):016x}"
+
+
+def decode_device_id(value: bytes) -> str:
+    """Decode byte-encoded device ID to a hex string."""
+    return f"{_from_bytes(value, 'little'):x}"
+
+
+def decode_display_brightness(value: bytes) -> int:
+    """Decode byte-encoded display brightness (1-101) to values 1-5."""
+    return int((_from_bytes(value, "little") + 24) / 25)
+
+
+def encode_display_brightness(value: int) -> int:
+    """Convert display brightness (1-5) to the device value (1-101)."""
+    return int(25 * value - 24)
+
+
+def encode_int_mul10(value: float) -> int:
+    """Convert a float value to an integer scaled by 10."""
+    return int(value * 10)
+
+
+def enum_decoder(enum: type[_EnumT]) -> Callable[[bytes], _EnumT]:
+    """Create a decoder for byte-encoded integer values of an enum.
+
+    Parameters
+    ----------
+    enum : type[Enum]
+        The enum class the decoded integer values are converted to.
+
+    Returns
+    -------
+    Callable[[bytes], Enum]
+        Function decoding a byte-encoded integer to a member of `enum`. Results
+        are cached by the raw value, as settings mostly report the same few values.
+
+    """
+
+    @lru_cache(maxsize=64)
+    def decode_enum(value: bytes) -> _EnumT:
+        return enum(_from_bytes(value, "little"))
+
+    return decode_enum
+
+
+@dataclass(frozen=True, slots=True)
+class CharacteristicSpec:
+    """Specification of a characteristic.
+
+    Attributes
+    ----------
+    uuid : UUID
+        UUID of the characteristic.
+    decode : Callable[[bytes], Any]
+        Decoder for values read from the characteristic.
+    convert : Callable[[Any], int] | None
+        Conversion of values written to the characteristic to integers.
+        `None` for read-only characteristics.
+    validate : Callable[[int], int] | None
+        Input sanitizing of converted values before they are written.
+        `None` for read-only characteristics.
+    response : bool
+        Whether writes have to be acknowledged by the device. If `False`, write
+        without response is used where the characteristic supports it.
+
+    """
+
+    uuid: UUID
+    decode: Callable[[bytes], Any]
+    convert: Callable[[Any], int] | None = None
+    validate: Callable[[int], int] | None = None
+    response: bool = True
+
+
+def enum_converter(enum: type[Enum]) -> Callable[[Any], int]:
+    """Create a converter for values of an enum.
+
+    Parameters
+    ----------
+    enum : type[Enum]
+        The enum class whose members are accepted by the converter.
+
+    Returns
+    -------
+    Callable[[Any], int]
+        Function returning the value of a member of `enum`, or its argument
+        converted to an integer otherwise.
+
+    """
+
+    def convert_enum(value: Any) -> int:
+        # enums with members cannot be subclassed, an identity check suffices
+        return value.value if type(value) is enum else int(value)
+
+    return convert_enum
+
+
+def validate_boost_temp(value: int) -> int:
+    """Clip boost temperature to 250-850, keeping 0 (disabled) unchanged."""
+    return clip(value, 250, 850) if value != 0 else 0
+
+
+def validate_power_limit(value: int) -> int:
+    """Round power limit down to steps of 5 and clip it to 0-120."""
+    return clip(floor(value / 5) * 5, 0, 120)
+
+
 # Map uuid, decoding, encoding and input sanitizing methods for each characteristic
-CHAR_MAP: dict[Characteristic, tuple] = {
-    CharBulk.LIVE_DATA: (const.CHAR_UUID_BULK_LIVE_DATA, decode_live_data),
-    CharBulk.BUILD: (const.CHAR_UUID_BULK_BUILD, decode_str),
-    CharBulk.DEVICE_SN: (
-        const.CHAR_UUID_BULK_DEVICE_SN,
-        lambda x: f"{decode_int(x):016x}",
-    ),
-    CharBulk.DEVICE_ID: (
-        const.CHAR_UUID_BULK_DEVICE_ID,
-        lambda x: f"{decode_int(x):x}",
-    ),
-    CharLive.LIVE_TEMP: (const.CHAR_UUID_LIVE_LIVE_TEMP, decode_int),
-    CharLive.SETPOINT_TEMP: (const.CHAR_UUID_LIVE_SETPOINT_TEMP, decode_int),
-    CharLive.DC_VOLTAGE: (
-        const.CHAR_UUID_LIVE_DC_VOLTAGE,
-        lambda x: decode_int(x) / 10,
-    ),
-    CharLive.HANDLE_TEMP: (
-        const.CHAR_UUID_LIVE_HANDLE_TEMP,
-        lambda x: decode_int(x) / 10,
-    ),
-    CharLive.PWM_LEVEL: (
-        const.CHAR_UUID_LIVE_PWM_LEVEL,
-        lambda x: int(decode_int(x) / 255 * 100),  # convert to percent
-    ),
-    CharLive.POWER_SRC: (
-        const.CHAR_UUID_LIVE_POWER_SRC,
-        lambda x: PowerSource(decode_int(x)),
-    ),
-    CharLive.TIP_RESISTANCE: (
-        const.CHAR_UUID_LIVE_TIP_RESISTANCE,
-        lambda x: decode_int(x) / 10,
-    ),
-    CharLive.UPTIME: (
-        const.CHAR_UUID_LIVE_UPTIME,
-        lambda x: decode_int(x) / 10,
-    ),
-    CharLive.MOVEMENT_TIME: (
-        const.CHAR_UUID_LIVE_MOVEMENT_TIME,
-        lambda x: decode_int(x) / 10,
-    ),
-    CharLive.TIP_VOLTAGE: (
-        const.CHAR_UUID_LIVE_TIP_VOLTAGE,
-        decode_int,
+CHAR_MAP: dict[Characteristic, CharacteristicSpec] = {
+    CharBulk.LIVE_DATA: CharacteristicSpec(
+        const.CHAR_UUID_BULK_LIVE_DATA, decode_live_data
+    ),
+    CharBulk.BUILD: CharacteristicSpec(const.CHAR_UUID_BULK_BUILD, decode_str),
+    CharBulk.DEVICE_SN: CharacteristicSpec(
+        const.CHAR_UUID_BULK_DEVICE_SN, decode_device_sn
+    ),
+    CharBulk.DEVICE_ID: CharacteristicSpec(
+        const.CHAR_UUID_BULK_DEVICE_ID, decode_device_id
+    ),
+    CharLive.LIVE_TEMP: CharacteristicSpec(const.CHAR_UUID_LIVE_LIVE_TEMP, decode_int),
+    CharLive.SETPOINT_TEMP: CharacteristicSpec(
+        const.CHAR_UUID_LIVE_SETPOINT_TEMP, decode_int
     ),
-    CharLive.HALL_SENSOR: (const.CHAR_UUID_LIVE_HALL_SENSOR, decode_int),
-    CharLive.OPERATING_MODE: (
+    CharLive.DC_VOLTAGE: CharacteristicSpec(
+        const.CHAR_UUID_LIVE_DC_VOLTAGE, decode_int_div10
+    ),
+    CharLive.HANDLE_TEMP: CharacteristicSpec(
+        const.CHAR_UUID_LIVE_HANDLE_TEMP, decode_int_div10
+    ),
+    CharLive.PWM_LEVEL: CharacteristicSpec(
+        const.CHAR_UUID_LIVE_PWM_LEVEL, decode_pwm_level
+    ),
+    CharLive.POWER_SRC: CharacteristicSpec(
+        const.CHAR_UUID_LIVE_POWER_SRC, enum_decoder(PowerSource)
+    ),
+    CharLive.TIP_RESISTANCE: CharacteristicSpec(
+        const.CHAR_UUID_LIVE_TIP_RESISTANCE, decode_int_div10
+    ),
+    CharLive.UPTIME: CharacteristicSpec(const.CHAR_UUID_LIVE_UPTIME, decode_int_div10),
+    CharLive.MOVEMENT_TIME: CharacteristicSpec(
+        const.CHAR_UUID_LIVE_MOVEMENT_TIME, decode_int_div10
+    ),
+    CharLive.TIP_VOLTAGE: CharacteristicSpec(
+        const.CHAR_UUID_LIVE_TIP_VOLTAGE, decode_int
+    ),
+    CharLive.HALL_SENSOR: CharacteristicSpec(
+        const.CHAR_UUID_LIVE_HALL_SENSOR, decode_int
+    ),
+    CharLive.OPERATING_MODE: CharacteristicSpec(
         const.CHAR_UUID_LIVE_OPERATING_MODE,
-        lambda x: OperatingMode(decode_int(x)),
+        enum_decoder(OperatingMode),
+    ),
+    CharLive.ESTIMATED_POWER: CharacteristicSpec(
+        const.CHAR_UUID_LIVE_ESTIMATED_POWER, decode_int
     ),
-    CharLive.ESTIMATED_POWER: (const.CHAR_UUID_LIVE_ESTIMATED_POWER, decode_int),
-    CharSetting.SETPOINT_TEMP: (
+    CharSetting.SETPOINT_TEMP: CharacteristicSpec(
         const.CHAR_UUID_SETTINGS_SETPOINT_TEMP,
         decode_int,
         int,
-        lambda x: clip(x, 10, 850),
+        clip_validator(10, 850),
     ),
-    CharSetting.SLEEP_TEMP: (
+    CharSetting.SLEEP_TEMP: CharacteristicSpec(
         const.CHAR_UUID_SETTINGS_SLEEP_TEMP,
         decode_int,
         int,
-        lambda x: clip(x, 10, 850),
+        clip_validator(10, 850),
     ),
-    CharSetting.SLEEP_TIMEOUT: (
+    CharSetting.SLEEP_TIMEOUT: CharacteristicSpec(
         const.CHAR_UUID_SETTINGS_SLEEP_TIMEOUT,
         decode_int,
         int,
-        lambda x: clip(x, 0, 15),
+        clip_validator(0, 15),
     ),
-    CharSetting.MIN_DC_VOLTAGE_CELLS: (
+    CharSetting.MIN_DC_VOLTAGE_CELLS: CharacteristicSpec(
         const.CHAR_UUID_SETTINGS_MIN_DC_VOLTAGE_CELLS,
-        lambda x: BatteryType(decode_int(x)),
-        lambda x: x.value if isinstance(x, BatteryType) else int(x),
-        lambda x: clip(x, 0, 4),
+        enum_decoder(BatteryType),
+        enum_converter(BatteryType),
+        clip_validator(0, 4),
     ),
-    CharSetting.MIN_VOLTAGE_PER_CELL: (
+    CharSetting.MIN_VOLTAGE_PER_CELL: CharacteristicSpec(
         const.CHAR_UUID_SETTINGS_MIN_VOLTAGE_PER_CELL,
-        lambda x: decode_int(x) / 10,
-        lambda x: int(x * 10),
-        lambda x: clip(x, 24, 38),
+        decode_int_div10,
+        encode_int_mul10,
+        clip_validator(24, 38),
     ),
-    CharSetting.QC_IDEAL_VOLTAGE: (
+    CharSetting.QC_IDEAL_VOLTAGE: CharacteristicSpec(
         const.CHAR_UUID_SETTINGS_QC_IDEAL_VOLTAGE,
-        lambda x: decode_int(x) / 10,
-        lambda x: int(x * 10),
-        lambda x: clip(x, 90, 220),
+        decode_int_div10,
+        encode_int_mul10,
+        clip_validator(90, 220),
     ),
-    CharSetting.ORIENTATION_MODE: (
+    CharSetting.ORIENTATION_MODE: CharacteristicSpec(
         const.CHAR_UUID_SETTINGS_ORIENTATION_MODE,
-        lambda x: ScreenOrientationMode(decode_int(x)),
-        lambda x: x.value if isinstance(x, ScreenOrientationMode) else int(x),
-        lambda x: clip(x, 0, 2),
+        enum_decoder(ScreenOrientationMode),
+        enum_converter(ScreenOrientationMode),
+        clip_validator(0, 2),
     ),
-    CharSetting.ACCEL_SENSITIVITY: (
+    CharSetting.ACCEL_SENSITIVITY: CharacteristicSpec(
         const.CHAR_UUID_SETTINGS_ACCEL_SENSITIVITY,
         decode_int,
         int,
-        lambda x: clip(x, 0, 9),
+        clip_validator(0, 9),
     ),
-    CharSetting.ANIMATION_LOOP: (
+    CharSetting.ANIMATION_LOOP: CharacteristicSpec(
         const.CHAR_UUID_SETTINGS_ANIMATION_LOOP,
-        lambda x: bool(decode_int(x)),
+        decode_bool,
         bool,
         int,
+        response=False,
     ),
-    CharSetting.ANIMATION_SPEED: (
+    CharSetting.ANIMATION_SPEED: CharacteristicSpec(
         const.CHAR_UUID_SETTINGS_ANIMATION_SPEED,
-        lambda x: AnimationSpeed(decode_int(x)),
-        lambda x: x.value if isinstance(x, AnimationSpeed) else int(x),
-        lambda x: clip(x, 0, 3),
+        enum_decoder(AnimationSpeed),
+        enum_converter(AnimationSpeed),
+        clip_validator(0, 3),
+        response=False,
     ),
-    CharSetting.AUTOSTART_MODE: (
+    CharSetting.AUTOSTART_MODE: CharacteristicSpec(
         const.CHAR_UUID_SETTINGS_AUTOSTART_MODE,
-        lambda x: AutostartMode(decode_int(x)),
-        lambda x: x.value if isinstance(x, AutostartMode) else int(x),
-        lambda x: clip(x, 0, 3),
+        enum_decoder(AutostartMode),
+        enum_converter(AutostartMode),
+        clip_validator(0, 3),
     ),
-    CharSetting.SHUTDOWN_TIME: (
+    CharSetting.SHUTDOWN_TIME: CharacteristicSpec(
         const.CHAR_UUID_SETTINGS_SHUTDOWN_TIME,
         decode_int,
         int,
-        lambda x: clip(x, 0, 60),
+        clip_validator(0, 60),
     ),
-    CharSetting.COOLING_TEMP_BLINK: (
+    CharSetting.COOLING_TEMP_BLINK: CharacteristicSpec(
         const.CHAR_UUID_SETTINGS_COOLING_TEMP_BLINK,
-        lambda x: bool(decode_int(x)),
+        decode_bool,
         bool,
         int,
     ),
-    CharSetting.IDLE_SCREEN_DETAILS: (
+    CharSetting.IDLE_SCREEN_DETAILS: CharacteristicSpec(
         const.CHAR_UUID_SETTINGS_IDLE_SCREEN_DETAILS,
-        lambda x: bool(decode_int(x)),
+        decode_bool,
         bool,
         int,
     ),
-    CharSetting.SOLDER_SCREEN_DETAILS: (
+    CharSetting.SOLDER_SCREEN_DETAILS: CharacteristicSpec(
         const.CHAR_UUID_SETTINGS_SOLDER_SCREEN_DETAILS,
-        lambda x: bool(decode_int(x)),
+        decode_bool,
         bool,
         int,
     ),
-    CharSetting.TEMP_UNIT: (
+    CharSetting.TEMP_UNIT: CharacteristicSpec(
         const.CHAR_UUID_SETTINGS_TEMP_UNIT,
-        lambda x: TempUnit(decode_int(x)),
-        lambda x: x.value if isinstance(x, TempUnit) else int(x),
-        lambda x: clip(x, 0, 1),
+        enum_decoder(TempUnit),
+        enum_converter(TempUnit),
+        clip_validator(0, 1),
     ),
-    CharSetting.DESC_SCROLL_SPEED: (
+    CharSetting.DESC_SCROLL_SPEED: CharacteristicSpec(
         const.CHAR_UUID_SETTINGS_DESC_SCROLL_SPEED,
-        lambda x: ScrollSpeed(decode_int(x)),
-        lambda x: x.value if isinstance(x, ScrollSpeed) else int(x),
-        lambda x: clip(x, 0, 1),
+        enum_decoder(ScrollSpeed),
+        enum_converter(ScrollSpeed),
+        clip_validator(0, 1),
+        response=False,
     ),
-    CharSetting.LOCKING_MODE: (
+    CharSetting.LOCKING_MODE: CharacteristicSpec(
         const.CHAR_UUID_SETTINGS_LOCKING_MODE,
-        lambda x: LockingMode(decode_int(x)),
-        lambda x: x.value if isinstance(x, LockingMode) else int(x),
-        lambda x: clip(x, 0, 2),
+        enum_decoder(LockingMode),
+        enum_converter(LockingMode),
+        clip_validator(0, 2),
     ),
-    CharSetting.KEEP_AWAKE_PULSE_POWER: (
+    CharSetting.KEEP_AWAKE_PULSE_POWER: CharacteristicSpec(
         const.CHAR_UUID_SETTINGS_KEEP_AWAKE_PULSE_POWER,
-        lambda x: decode_int(x) / 10,
-        lambda x: int(x * 10),
-        lambda x: clip(x, 0, 99),
+        decode_int_div10,
+        encode_int_mul10,
+        clip_validator(0, 99),
     ),
-    CharSetting.KEEP_AWAKE_PULSE_DELAY: (
+    CharSetting.KEEP_AWAKE_PULSE_DELAY: CharacteristicSpec(
         const.CHAR_UUID_SETTINGS_KEEP_AWAKE_PULSE_DELAY,
         decode_int,
         int,
-        lambda x: clip(x, 0, 9),
+        clip_validator(0, 9),
     ),
-    CharSetting.KEEP_AWAKE_PULSE_DURATION: (
+    CharSetting.KEEP_AWAKE_PULSE_DURATION: CharacteristicSpec(
         const.CHAR_UUID_SETTINGS_KEEP_AWAKE_PULSE_DURATION,
         decode_int,
         int,
-        lambda x: clip(x, 0, 9),
+        clip_validator(0, 9),
     ),
-    CharSetting.VOLTAGE_DIV: (
+    CharSetting.VOLTAGE_DIV: CharacteristicSpec(
         const.CHAR_UUID_SETTINGS_VOLTAGE_DIV,
         decode_int,
         int,
-        lambda x: clip(x, 360, 900),
+        clip_validator(360, 900),
     ),
-    CharSetting.BOOST_TEMP: (
+    CharSetting.BOOST_TEMP: CharacteristicSpec(
         const.CHAR_UUID_SETTINGS_BOOST_TEMP,
         decode_int,
         int,
-        lambda x: clip(x, 250, 850) if x != 0 else 0,
+        validate_boost_temp,
     ),
-    CharSetting.CALIBRATION_OFFSET: (
+    CharSetting.CALIBRATION_OFFSET: CharacteristicSpec(
         const.CHAR_UUID_SETTINGS_CALIBRATION_OFFSET,
         decode_int,
         int,
-        lambda x: clip(x, 100, 2500),
+        clip_validator(100, 2500),
     ),
-    CharSetting.POWER_LIMIT: (
+    CharSetting.POWER_LIMIT: CharacteristicSpec(
         const.CHAR_UUID_SETTINGS_POWER_LIMIT,
-        lambda x: decode_int(x),
+        decode_int,
         int,
-        lambda x: clip(floor(x / 5) * 5, 0, 120),
+        validate_power_limit,
     ),
-    CharSetting.INVERT_BUTTONS: (
+    CharSetting.INVERT_BUTTONS: CharacteristicSpec(
         const.CHAR_UUID_SETTINGS_INVERT_BUTTONS,
-        lambda x: bool(decode_int(x)),
+        decode_bool,
         bool,
         int,
     ),
-    CharSetting.TEMP_INCREMENT_LONG: (
+    CharSetting.TEMP_INCREMENT_LONG: CharacteristicSpec(
         const.CHAR_UUID_SETTINGS_TEMP_INCREMENT_LONG,
         decode_int,
         int,
-        lambda x: clip(x, 5, 90),
+        clip_validator(5, 90),
     ),
-    CharSetting.TEMP_INCREMENT_SHORT: (
+    CharSetting.TEMP_INCREMENT_SHORT: CharacteristicSpec(
         const.CHAR_UUID_SETTINGS_TEMP_INCREMENT_SHORT,
         decode_int,
         int,
-        lambda x: clip(x, 1, 50),
+        clip_validator(1, 50),
     ),
-    CharSetting.HALL_SENSITIVITY: (
+    CharSetting.HALL_SENSITIVITY: CharacteristicSpec(
         const.CHAR_UUID_SETTINGS_HALL_SENSITIVITY,
         decode_int,
         int,
-        lambda x: clip(x, 0, 9),
+        clip_validator(0, 9),
     ),
-    CharSetting.ACCEL_WARN_COUNTER: (
+    CharSetting.ACCEL_WARN_COUNTER: CharacteristicSpec(
         const.CHAR_UUID_SETTINGS_ACCEL_WARN_COUNTER,
         decode_int,
         int,
-        lambda x: clip(x, 0, 9),
+        clip_validator(0, 9),
     ),
-    CharSetting.PD_WARN_COUNTER: (
+    CharSetting.PD_WARN_COUNTER: CharacteristicSpec(
         const.CHAR_UUID_SETTINGS_PD_WARN_COUNTER,
         decode_int,
         int,
-        lambda x: clip(x, 0, 9),
+        clip_validator(0, 9),
     ),
-    CharSetting.UI_LANGUAGE: (
+    CharSetting.UI_LANGUAGE: CharacteristicSpec(
         const.CHAR_UUID_SETTINGS_UI_LANGUAGE,
         decode_lang_code,
         encode_lang_code,
-        lambda x: clip(x, 0, 65535),
+        clip_validator(0, 65535),
     ),
-    CharSetting.PD_NEGOTIATION_TIMEOUT: (
+    CharSetting.PD_NEGOTIATION_TIMEOUT: CharacteristicSpec(
         const.CHAR_UUID_SETTINGS_PD_NEGOTIATION_TIMEOUT,
-        lambda x,: decode_int(x) / 10,
-        lambda x: int(x * 10),
-        lambda x: clip(x, 0, 50),
+        decode_int_div10,
+        encode_int_mul10,
+        clip_validator(0, 50),
     ),
-    CharSetting.DISPLAY_INVERT: (
+    CharSetting.DISPLAY_INVERT: CharacteristicSpec(
         const.CHAR_UUID_SETTINGS_DISPLAY_INVERT,
-        lambda x: bool(decode_int(x)),
+        decode_bool,
         bool,
         int,
+        response=False,
     ),
-    CharSetting.DISPLAY_BRIGHTNESS: (
+    CharSetting.DISPLAY_BRIGHTNESS: CharacteristicSpec(
         const.CHAR_UUID_SETTINGS_DISPLAY_BRIGHTNESS,
-        lambda x: int((decode_int(x) + 24) / 25),  # convert to values 1-5
-        lambda x: int(25 * x - 24),
-        lambda x: clip(x, 1, 101),
+        decode_display_brightness,
+        encode_display_brightness,
+        clip_validator(1, 101),
+        response=False,
     ),
-    CharSetting.LOGO_DURATION: (
+    CharSetting.LOGO_DURATION: CharacteristicSpec(
         const.CHAR_UUID_SETTINGS_LOGO_DURATION,
-        lambda x: LogoDuration(decode_int(x)),
-        lambda x: x.value if isinstance(x, LogoDuration) else int(x),
-        lambda x: clip(x, 0, 6),
+        enum_decoder(LogoDuration),
+        enum_converter(LogoDuration),
+        clip_validator(0, 6),
     ),
-    CharSetting.CALIBRATE_CJC: (
+    CharSetting.CALIBRATE_CJC: CharacteristicSpec(
         const.CHAR_UUID_SETTINGS_CALIBRATE_CJC,
-        lambda x: bool(decode_int(x)),
+        decode_bool,
         bool,
         int,
     ),
-    CharSetting.BLE_ENABLED: (
+    CharSetting.BLE_ENABLED: CharacteristicSpec(
         const.CHAR_UUID_SETTINGS_BLE_ENABLED,
-        lambda x: bool(decode_int(x)),
+        decode_bool,
         bool,
         int,
     ),
-    CharSetting.USB_PD_MODE: (
+    CharSetting.USB_PD_MODE: CharacteristicSpec(
         const.CHAR_UUID_SETTINGS_USB_PD_MODE,
-        lambda x: USBPDMode(decode_int(x)),
-        lambda x: x.value if isinstance(x, USBPDMode) else int(x),
-        lambda x: clip(x, 0, 2),
+        enum_decoder(USBPDMode),
+        enum_converter(USBPDMode),
+        clip_validator(0, 2),
     ),
-    CharSetting.SETTINGS_SAVE: (
+    CharSetting.SETTINGS_SAVE: CharacteristicSpec(
         const.CHAR_UUID_SETTINGS_SAVE,
-        lambda x: bool(decode_int(x)),
+        decode_bool,
         bool,
         int,
     ),
-    CharSetting.SETTINGS_RESET: (
+    CharSetting.SETTINGS_RESET: CharacteristicSpec(
         const.CHAR_UUID_SETTINGS_RESET,
-        lambda x: bool(decode_int(x)),
+        decode_bool,
         bool,
         int,
     ),
 }
+
+# Setting characteristics and their response keys, precomputed for `get_settings`
+SETTINGS: tuple[tuple[CharSetting, str], ...] = tuple(
+    (characteristic, characteristic.name.lower())
+    for characteristic in CHAR_MAP
+    if isinstance(characteristic, CharSetting)
+)
+SETTINGS_BY_ID: dict[int, CharSetting] = {
+    characteristic.value: characteristic for characteristic, _ in SETTINGS
+}
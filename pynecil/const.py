@@ -70,4 +70,10 @@ CHAR_UUID_SETTINGS_CALIBRATE_CJC = UUID("f6d70024-5a10-4eba-aa55-33e27f9bc533")
 CHAR_UUID_SETTINGS_BLE_ENABLED = UUID("f6d70025-5a10-4eba-aa55-33e27f9bc533")
 CHAR_UUID_SETTINGS_USB_PD_MODE = UUID("f6d70026-5a10-4eba-aa55-33e27f9bc533")
 
+# Attempts and base delay (in seconds) for GATT requests failing with transient errors
+GATT_MAX_ATTEMPTS = 3
+GATT_RETRY_DELAY = 0.05
+
 GITHUB_LATEST_RELEASES_URL = "https://api.github.com/repos/Ralim/IronOS/releases/latest"
+# Time in seconds a fetched IronOS release is reused before asking Github again
+RELEASE_CACHE_TTL = 300
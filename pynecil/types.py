@@ -230,7 +230,7 @@ class USBPDMode(Enum):
     SAFE = 2
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviceInfoResponse:
     """Response data with information about the Pinecil device.
 
@@ -257,7 +257,7 @@ class DeviceInfoResponse:
     is_synced: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class LiveDataResponse:
     """Live data response class.
 
@@ -2,15 +2,17 @@
 
 from __future__ import annotations
 
+import asyncio
+import time
 from dataclasses import dataclass
 
-from aiohttp import ClientError, ClientSession
+from aiohttp import ClientError, ClientSession, hdrs
 
-from .const import GITHUB_LATEST_RELEASES_URL
+from .const import GITHUB_LATEST_RELEASES_URL, RELEASE_CACHE_TTL
 from .exceptions import UpdateException
 
 
-@dataclass(kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class LatestRelease:
     """Latest release data."""
 
@@ -31,18 +33,48 @@ class IronOSUpdate:
 
         self._session = session
         self.url = GITHUB_LATEST_RELEASES_URL
+        self._etag: str | None = None
+        self._latest_release: LatestRelease | None = None
+        self._fetched_at = 0.0
+        self._lock = asyncio.Lock()
 
     async def latest_release(self) -> LatestRelease:
-        """Fetch latest IronOS release."""
+        """Fetch latest IronOS release.
+
+        A release fetched less than `RELEASE_CACHE_TTL` seconds ago is returned
+        without contacting Github, and concurrent calls share a single request.
+        """
+        async with self._lock:
+            if (
+                self._latest_release is not None
+                and time.monotonic() - self._fetched_at < RELEASE_CACHE_TTL
+            ):
+                return self._latest_release
+            self._latest_release = await self._fetch_latest_release()
+            self._fetched_at = time.monotonic()
+            return self._latest_release
+
+    async def _fetch_latest_release(self) -> LatestRelease:
+        """Request latest IronOS release from Github.
+
+        The request is conditional on the ETag of the previous response, so an
+        unchanged release is served from cache without transferring it again.
+        """
+        headers = {hdrs.IF_NONE_MATCH: self._etag} if self._etag else None
         try:
-            async with self._session.get(self.url) as response:
+            async with self._session.get(self.url, headers=headers) as response:
+                if response.status == 304 and self._latest_release is not None:
+                    return self._latest_release
+                response.raise_for_status()
                 data = await response.json()
-                return LatestRelease(
+                release = LatestRelease(
                     tag_name=data["tag_name"],
                     name=data["name"],
                     html_url=data["html_url"],
                     body=data["body"],
                 )
+                self._etag = response.headers.get(hdrs.ETAG)
+                return release
         except ClientError:
             raise UpdateException("Failed to fetch latest IronOS release from Github")
         except KeyError:
@@ -1 +1,22 @@
 """Fixtures for Tests."""
+
+from collections.abc import Generator
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+
+@pytest.fixture
+def mock_bleak_client() -> Generator[MagicMock]:
+    """Mock a connected BleakClient."""
+    with patch("pynecil.client.BleakClient") as mock_client:
+        client = mock_client.return_value
+        client.is_connected = True
+        client.address = "AA:BB:CC:DD:EE:FF"
+        client.services.characteristics = {}
+        client.read_gatt_char = AsyncMock(return_value=bytearray(b"\x00\x00"))
+        client.write_gatt_char = AsyncMock()
+        client.start_notify = AsyncMock()
+        client.connect = AsyncMock()
+        client.disconnect = AsyncMock()
+        yield client
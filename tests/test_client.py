@@ -0,0 +1,225 @@
+"""Tests for the Pynecil client."""
+
+import asyncio
+import struct
+from unittest.mock import MagicMock
+
+import pytest
+from bleak.exc import BleakCharacteristicNotFoundError, BleakError
+
+from pynecil import (
+    CharSetting,
+    CommunicationError,
+    OperatingMode,
+    PowerSource,
+    Pynecil,
+    const,
+)
+from pynecil import client as pynecil_client
+
+LIVE_DATA = struct.pack(
+    "<14I", 123, 320, 200, 250, 128, 3, 62, 1000, 0, 450, 80, 0, 1, 50
+)
+
+
+def disconnect(mock_bleak_client: MagicMock) -> None:
+    """Simulate the device dropping the connection."""
+    mock_bleak_client.is_connected = False
+    callback = pynecil_client.BleakClient.call_args.kwargs["disconnected_callback"]
+    callback(mock_bleak_client)
+
+
+@pytest.mark.usefixtures("mock_bleak_client")
+def test_max_concurrent_reads_invalid() -> None:
+    """Test that at least one concurrent read is required."""
+    with pytest.raises(ValueError):
+        Pynecil("AA:BB:CC:DD:EE:FF", max_concurrent_reads=0)
+
+
+async def test_live_data_reset_on_disconnect(mock_bleak_client: MagicMock) -> None:
+    """Test that pushed live data is dropped when a custom callback handles disconnects."""
+    client = Pynecil("AA:BB:CC:DD:EE:FF", disconnected_callback=MagicMock())
+    assert await client.start_live_notifications()
+    on_live_data = mock_bleak_client.start_notify.call_args.args[1]
+    on_live_data(None, bytearray(LIVE_DATA))
+    assert (await client.get_live_data()).live_temp == 123
+    mock_bleak_client.read_gatt_char.assert_not_called()
+
+    disconnect(mock_bleak_client)
+
+    mock_bleak_client.read_gatt_char.return_value = bytearray(56)
+    assert (await client.get_live_data()).live_temp == 0
+    mock_bleak_client.read_gatt_char.assert_called_once()
+
+
+async def test_reconnect_once(mock_bleak_client: MagicMock) -> None:
+    """Test that concurrent reads failing on a dropped link reconnect only once."""
+    client = Pynecil("AA:BB:CC:DD:EE:FF")
+    await client.connect()
+    mock_bleak_client.connect.reset_mock()
+    link_dropped = asyncio.Event()
+
+    async def connect() -> None:
+        await asyncio.sleep(0)
+        mock_bleak_client.is_connected = True
+
+    async def read_gatt_char(_: object) -> bytearray:
+        if not link_dropped.is_set():
+            await link_dropped.wait()
+            raise BleakError("Not connected")
+        return bytearray(b"\x00\x00")
+
+    mock_bleak_client.connect.side_effect = connect
+    mock_bleak_client.read_gatt_char.side_effect = read_gatt_char
+    task = asyncio.create_task(client.get_settings())
+    while mock_bleak_client.read_gatt_char.await_count < 4:
+        await asyncio.sleep(0)
+    disconnect(mock_bleak_client)
+    link_dropped.set()
+
+    await task
+
+    mock_bleak_client.connect.assert_awaited_once()
+    mock_bleak_client.disconnect.assert_awaited_once()
+
+
+async def test_permanent_error_not_retried(mock_bleak_client: MagicMock) -> None:
+    """Test that a missing characteristic fails without retrying."""
+    client = Pynecil("AA:BB:CC:DD:EE:FF")
+    mock_bleak_client.read_gatt_char.side_effect = BleakCharacteristicNotFoundError(
+        "f6d70000-5a10-4eba-aa55-33e27f9bc533"
+    )
+
+    with pytest.raises(CommunicationError):
+        await client.read(CharSetting.SETPOINT_TEMP)
+
+    mock_bleak_client.read_gatt_char.assert_awaited_once()
+
+
+async def test_connect_not_retried(mock_bleak_client: MagicMock) -> None:
+    """Test that a failing connection attempt is not retried."""
+    client = Pynecil("AA:BB:CC:DD:EE:FF")
+    mock_bleak_client.is_connected = False
+    mock_bleak_client.connect.side_effect = TimeoutError
+
+    with pytest.raises(CommunicationError):
+        await client.get_settings()
+
+    mock_bleak_client.connect.assert_awaited_once()
+    mock_bleak_client.read_gatt_char.assert_not_called()
+
+
+async def test_get_live_data_from_notifications(mock_bleak_client: MagicMock) -> None:
+    """Test that live data is served from notifications without reading."""
+    client = Pynecil("AA:BB:CC:DD:EE:FF")
+    assert await client.start_live_notifications()
+    on_live_data = mock_bleak_client.start_notify.call_args.args[1]
+    on_live_data(None, bytearray(LIVE_DATA))
+
+    live_data = await client.get_live_data()
+
+    assert live_data.live_temp == 123
+    assert live_data.dc_voltage == 20.0
+    assert live_data.pwm_level == 50
+    assert live_data.power_src is PowerSource.PD
+    assert live_data.operating_mode is OperatingMode.SOLDERING
+    assert await client.get_live_data() is live_data
+    mock_bleak_client.read_gatt_char.assert_not_called()
+
+
+async def test_stream_live_data_ends_on_disconnect(
+    mock_bleak_client: MagicMock,
+) -> None:
+    """Test that the live data stream yields notifications until disconnected."""
+    client = Pynecil("AA:BB:CC:DD:EE:FF")
+    received = []
+
+    async def consume() -> None:
+        async for live_data in client.stream_live_data():
+            received.append(live_data.live_temp)
+
+    task = asyncio.create_task(consume())
+    while not mock_bleak_client.start_notify.called:
+        await asyncio.sleep(0)
+    await asyncio.sleep(0)
+    on_live_data = mock_bleak_client.start_notify.call_args.args[1]
+    on_live_data(None, bytearray(LIVE_DATA))
+    await asyncio.sleep(0)
+    disconnect(mock_bleak_client)
+
+    await asyncio.wait_for(task, 1)
+
+    assert received == [123]
+    mock_bleak_client.read_gatt_char.assert_not_called()
+
+
+async def test_stream_live_data_polling(mock_bleak_client: MagicMock) -> None:
+    """Test that the live data stream polls if notifications are not supported."""
+    client = Pynecil("AA:BB:CC:DD:EE:FF")
+    mock_bleak_client.start_notify.side_effect = BleakError
+    mock_bleak_client.read_gatt_char.return_value = bytearray(LIVE_DATA)
+    received = []
+
+    stream = client.stream_live_data(interval=0)
+    async for live_data in stream:
+        received.append(live_data.live_temp)
+        if len(received) == 2:
+            break
+    await stream.aclose()
+
+    assert received == [123, 123]
+    assert mock_bleak_client.read_gatt_char.await_count == 2
+
+
+async def test_read_retry_communication_error(
+    mock_bleak_client: MagicMock, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that reads are retried before raising a CommunicationError."""
+    monkeypatch.setattr(const, "GATT_RETRY_DELAY", 0)
+    client = Pynecil("AA:BB:CC:DD:EE:FF")
+    mock_bleak_client.read_gatt_char.side_effect = BleakError
+
+    with pytest.raises(CommunicationError):
+        await client.read(CharSetting.SETPOINT_TEMP)
+
+    assert mock_bleak_client.read_gatt_char.await_count == const.GATT_MAX_ATTEMPTS
+
+
+async def test_read_retry_success(
+    mock_bleak_client: MagicMock, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that a transient error is recovered by retrying the read."""
+    monkeypatch.setattr(const, "GATT_RETRY_DELAY", 0)
+    client = Pynecil("AA:BB:CC:DD:EE:FF")
+    mock_bleak_client.read_gatt_char.side_effect = [TimeoutError, b",\x01"]
+
+    assert await client.read(CharSetting.SETPOINT_TEMP) == 300
+    assert mock_bleak_client.read_gatt_char.await_count == 2
+
+
+async def test_read_after_write_not_coalesced(mock_bleak_client: MagicMock) -> None:
+    """Test that a read after a write does not join a read started before it."""
+    client = Pynecil("AA:BB:CC:DD:EE:FF")
+    device_value = bytearray(b"\x00\x00")
+    release = asyncio.Event()
+
+    async def read_gatt_char(_: object) -> bytearray:
+        value = bytearray(device_value)
+        if mock_bleak_client.read_gatt_char.await_count == 1:
+            await release.wait()
+        return value
+
+    async def write_gatt_char(_: object, data: bytes, response: bool) -> None:
+        device_value[:] = data
+
+    mock_bleak_client.read_gatt_char.side_effect = read_gatt_char
+    mock_bleak_client.write_gatt_char.side_effect = write_gatt_char
+    stale_read = asyncio.create_task(client.read(CharSetting.SETPOINT_TEMP))
+    await asyncio.sleep(0)
+
+    await client.write(CharSetting.SETPOINT_TEMP, 300)
+
+    assert await client.read(CharSetting.SETPOINT_TEMP) == 300
+    release.set()
+    assert await stale_read == 0
+    assert mock_bleak_client.read_gatt_char.await_count == 2